@@ -0,0 +1,93 @@
+import random
+
+from src.vss_core.protocol import Dealer
+
+class MaliciousDealer(Dealer):
+    """
+    A Dealer that cheats in one of several ways. Every 'distribute_*' method
+    returns the same bundle as Dealer.distribute_secret, plus:
+        'commitment_views': {pid: commitments} if participants were shown
+                            different commitment vectors,
+        'forged_shares':    {pid: value} shares the coalition will submit at
+                            reconstruction instead of their real ones.
+    """
+    STRATEGIES = ("random_shares", "wrong_commitment", "inconsistent_commitments", "colluding")
+
+    def __init__(self, threshold, num_shares, engine=None, rng=None):
+        super().__init__(threshold, num_shares, engine)
+        self.rng = rng if rng else random.Random()
+
+    def distribute_corrupted_secret(self, secret, victim_id):
+        """
+        Runs the normal distribution, but intentionally modifies
+        the share for 'victim_id' so it no longer matches the polynomial.
+        """
+        # 1. Run honest distribution first
+        data = self.distribute_secret(secret)
+
+        # 2. Corrupt the specific victim's share
+        corrupted_shares = []
+        for participant_id, share_val in data['shares']:
+            if participant_id == victim_id:
+                # Add 1 to the share value (breaking the point on the curve)
+                fake_val = (share_val + 1) % self.engine.n
+                corrupted_shares.append((participant_id, fake_val))
+            else:
+                corrupted_shares.append((participant_id, share_val))
+
+        # 3. Return the bundle with the fake share
+        data['shares'] = corrupted_shares
+        return data
+
+    def distribute_with_strategy(self, strategy, secret=None, num_corrupted=1):
+        """Dispatches to one of the STRATEGIES below."""
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown corruption strategy '{strategy}' (expected one of {self.STRATEGIES})")
+        return getattr(self, f"distribute_{strategy}")(secret, num_corrupted)
+
+    def _pick_victims(self, count):
+        return set(self.rng.sample(range(1, self.n + 1), min(count, self.n)))
+
+    def distribute_random_shares(self, secret=None, num_corrupted=1):
+        """Replaces the shares of 'num_corrupted' random participants with random values."""
+        data = self.distribute_secret(secret)
+        victims = self._pick_victims(num_corrupted)
+        data['shares'] = [(pid, self.engine.generate_secret() if pid in victims else val)
+                          for pid, val in data['shares']]
+        return data
+
+    def distribute_wrong_commitment(self, secret=None, num_corrupted=1):
+        """Publishes a commitment to a different coefficient than the one used for the shares."""
+        data = self.distribute_secret(secret)
+        j = self.rng.randrange(len(data['commitments']))
+        data['commitments'][j] = self.engine.get_commitment(self.engine.generate_secret())
+        return data
+
+    def distribute_inconsistent_commitments(self, secret=None, num_corrupted=1):
+        """
+        Equivocates: 'num_corrupted' participants get shares and commitments from a
+        second polynomial, everyone else from the first. Each share verifies against
+        the vector its holder was shown, so only comparing vectors reveals the cheat.
+        """
+        data = self.distribute_secret(secret)
+        victims = self._pick_victims(num_corrupted)
+
+        alt_coeffs = self.generate_polynomial(data['secret_kept_by_dealer'])
+        alt_commitments = self.generate_commitments(alt_coeffs)
+
+        data['shares'] = [(pid, self.evaluate_polynomial(alt_coeffs, pid) if pid in victims else val)
+                          for pid, val in data['shares']]
+        data['commitment_views'] = {pid: alt_commitments if pid in victims else data['commitments']
+                                    for pid, _ in data['shares']}
+        return data
+
+    def distribute_colluding(self, secret=None, num_corrupted=1):
+        """
+        Deals honestly, but a coalition of 'num_corrupted' participants (at most t-1)
+        plans to submit forged shares at reconstruction to steer the recovered secret.
+        """
+        data = self.distribute_secret(secret)
+        coalition = self._pick_victims(min(num_corrupted, self.t - 1))
+        data['forged_shares'] = {pid: (val + self.engine.generate_secret()) % self.engine.n
+                                 for pid, val in data['shares'] if pid in coalition}
+        return data
@@ -0,0 +1,201 @@
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.simulation.adversary import MaliciousDealer
+from src.vss_core.crypto_engine import get_engine
+from src.vss_core.reconstruction import reconstruct_secret
+
+def commitment_digest(commitments):
+    """What participants echo to each other to confirm they saw the same commitment vector."""
+    h = hashlib.sha256()
+    for point in commitments:
+        h.update(f"{point.x},{point.y};".encode())
+    return h.hexdigest()
+
+def run_dealing(dealer, strategy=None, num_corrupted=1):
+    """
+    Runs one dealing through the full pipeline and reports what was caught.
+
+    1. Sharing: every participant checks its own share with verify_share against the
+       commitments it was shown, and the digests of those vectors are compared.
+    2. Reconstruction (only if nobody complained): every participant submits a share,
+       each submission is checked with verify_share, and t valid ones recover f(0).
+
+    Separately, a batched auditor who sees the whole dealing runs batch_verify_shares
+    over it. That figure is timed on its own: no single participant can batch.
+
+    Args:
+        dealer (MaliciousDealer): Deals honestly when 'strategy' is None.
+        strategy (str): One of MaliciousDealer.STRATEGIES, or None.
+
+    Returns:
+        dict: Flags and counters for this dealing (see the keys below).
+    """
+    engine = dealer.engine
+    if strategy is None:
+        data = dealer.distribute_secret()
+    else:
+        data = dealer.distribute_with_strategy(strategy, num_corrupted=num_corrupted)
+
+    shares = data['shares']
+    views = data.get('commitment_views') or {pid: data['commitments'] for pid, _ in shares}
+
+    # Only the verify_share calls are timed, not hashing or reconstruction
+    verify_seconds = 0.0
+    def verify(pid, val, commitments):
+        nonlocal verify_seconds
+        start = time.perf_counter()
+        ok = engine.verify_share(pid, val, commitments)
+        verify_seconds += time.perf_counter() - start
+        return ok
+
+    # --- Phase 1: Share verification + commitment echo ---
+    complaints = [pid for pid, val in shares if not verify(pid, val, views[pid])]
+    equivocation = len({commitment_digest(view) for view in views.values()}) > 1
+    verifications = len(shares)
+
+    # --- Phase 2: Reconstruction from checked submissions ---
+    rejected = []
+    reconstructed_ok = None
+    if not complaints and not equivocation:
+        forged = data.get('forged_shares', {})
+        submitted = [(pid, forged.get(pid, val)) for pid, val in shares]
+        rejected = [pid for pid, val in submitted if not verify(pid, val, data['commitments'])]
+        verifications += len(submitted)
+
+        accepted = [s for s in submitted if s[0] not in rejected][:dealer.t]
+        if len(accepted) == dealer.t:
+            reconstructed_ok = reconstruct_secret(accepted, engine.n) == data['secret_kept_by_dealer']
+        else:
+            reconstructed_ok = False
+
+    # --- Batched auditor: one combined check per commitment vector ---
+    start = time.perf_counter()
+    groups = {}
+    for pid, val in shares:
+        groups.setdefault(id(views[pid]), (views[pid], []))[1].append((pid, val))
+    auditor_flagged = []
+    for commitments, group in groups.values():
+        auditor_flagged.extend(engine.batch_verify_shares(group, commitments))
+    auditor_seconds = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "malicious": strategy is not None,
+        "detected": bool(complaints or equivocation or rejected),
+        "complaints": len(complaints),
+        "equivocation": equivocation,
+        "rejected_at_reconstruction": len(rejected),
+        "reconstructed_ok": reconstructed_ok,
+        "verifications": verifications,
+        "verify_seconds": verify_seconds,
+        "auditor_flagged": len(auditor_flagged),
+        "auditor_shares": len(shares),
+        "auditor_seconds": auditor_seconds,
+    }
+
+def _run_chunk(plan, threshold, num_shares, num_corrupted, seed):
+    dealer = MaliciousDealer(threshold, num_shares, get_engine(), rng=random.Random(seed))
+    return [run_dealing(dealer, strategy, num_corrupted) for strategy in plan]
+
+def summarize(results, elapsed):
+    """
+    Aggregates per-dealing results into detection, false-positive and throughput figures.
+    The verification rates count per-participant verify_share calls; the batched
+    auditor's rate is reported separately.
+    """
+    malicious = [r for r in results if r['malicious']]
+    honest = [r for r in results if not r['malicious']]
+    reconstructions = [r for r in results if r['reconstructed_ok'] is not None]
+    verifications = sum(r['verifications'] for r in results)
+    verify_seconds = sum(r['verify_seconds'] for r in results)
+    auditor_shares = sum(r['auditor_shares'] for r in results)
+    auditor_seconds = sum(r['auditor_seconds'] for r in results)
+
+    per_strategy = {}
+    for r in malicious:
+        stats = per_strategy.setdefault(r['strategy'], {"dealings": 0, "detected": 0})
+        stats['dealings'] += 1
+        stats['detected'] += r['detected']
+    for stats in per_strategy.values():
+        stats['detection_rate'] = stats['detected'] / stats['dealings']
+
+    return {
+        "dealings": len(results),
+        "malicious": len(malicious),
+        "honest": len(honest),
+        "detection_rate": sum(r['detected'] for r in malicious) / len(malicious) if malicious else None,
+        "false_positive_rate": sum(r['detected'] for r in honest) / len(honest) if honest else None,
+        "reconstruction_success_rate": (sum(r['reconstructed_ok'] for r in reconstructions) / len(reconstructions)
+                                        if reconstructions else None),
+        "per_strategy": per_strategy,
+        "verifications": verifications,
+        "elapsed": elapsed,
+        "verifications_per_sec": verifications / elapsed if elapsed > 0 else float('inf'),
+        "verifications_per_cpu_sec": verifications / verify_seconds if verify_seconds > 0 else float('inf'),
+        "batched_auditor_shares_per_cpu_sec": (auditor_shares / auditor_seconds if auditor_seconds > 0
+                                               else float('inf')),
+    }
+
+def run_simulation(num_dealings=1000, threshold=3, num_shares=5, malicious_fraction=0.2,
+                   strategies=MaliciousDealer.STRATEGIES, num_corrupted=1,
+                   workers=None, chunk_size=50, seed=None):
+    """
+    Simulates many dealings, a fraction of them by malicious dealers, and measures
+    how well (and how fast) verification copes.
+
+    Args:
+        num_dealings (int): Total dealings to simulate.
+        malicious_fraction (float): Share of dealings run by a malicious dealer.
+        strategies (tuple): Corruption strategies malicious dealers pick from at random.
+        num_corrupted (int): Shares / participants each attack targets.
+        workers (int): Process count (default: CPU count). 1 runs in this process.
+        chunk_size (int): Dealings handed to a worker per task.
+        seed: Makes the plan (who cheats, how, and whom) reproducible.
+
+    Returns:
+        dict: See summarize(); 'results' holds the per-dealing records.
+    """
+    rng = random.Random(seed)
+    num_malicious = round(num_dealings * malicious_fraction)
+    plan = [rng.choice(strategies) for _ in range(num_malicious)] + [None] * (num_dealings - num_malicious)
+    rng.shuffle(plan)
+
+    tasks = [(plan[i:i + chunk_size], threshold, num_shares, num_corrupted, rng.getrandbits(64))
+             for i in range(0, num_dealings, chunk_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [r for task in tasks for r in _run_chunk(*task)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, *task) for task in tasks]
+            results = [r for future in futures for r in future.result()]
+    elapsed = time.perf_counter() - start
+
+    report = summarize(results, elapsed)
+    report['results'] = results
+    return report
+
+if __name__ == "__main__":
+    import sys
+
+    num_dealings = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    fraction = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    print(f"[+] Simulating {num_dealings} dealings (3-of-5), {fraction:.0%} malicious, "
+          f"on {os.cpu_count()} CPU(s)...")
+    report = run_simulation(num_dealings, malicious_fraction=fraction)
+
+    print(f"    Detection rate      : {report['detection_rate']}")
+    print(f"    False-positive rate : {report['false_positive_rate']}")
+    print(f"    Reconstruction OK   : {report['reconstruction_success_rate']}")
+    for strategy, stats in sorted(report['per_strategy'].items()):
+        print(f"      {strategy:<26} {stats['detected']}/{stats['dealings']} detected")
+    print(f"    Verification        : {report['verifications_per_cpu_sec']:.0f} verify_share/s per process")
+    print(f"    Whole pipeline      : {report['verifications_per_sec']:.0f} verified shares/s of wall time "
+          f"({report['elapsed']:.1f}s, dealing and reconstruction included)")
+    print(f"    Batched auditor     : {report['batched_auditor_shares_per_cpu_sec']:.0f} shares/s per process")
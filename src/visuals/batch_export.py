@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-worker state, set up once by _init_worker so each process keeps one figure
+_worker = {}
+
+def _init_worker(shares, commitments, engine):
+    """Runs once in every worker: builds the Visualizer (it renders on its own Agg canvas)."""
+    # matplotlib is only loaded where something is actually drawn
+    from src.visuals.plotter import Visualizer
+
+    _worker["viz"] = Visualizer(engine)
+    _worker["shares"] = shares
+    _worker["share_map"] = dict(shares)
+    _worker["commitments"] = commitments
+
+def _render_chunk(participant_ids, out_dir, fmt, flagged_only):
+    """Verifies each participant in the chunk and renders the dashboards that are needed."""
+    viz = _worker["viz"]
+    results = []
+    for pid in participant_ids:
+        is_valid = viz.engine.verify_share(pid, _worker["share_map"][pid], _worker["commitments"])
+        path = None
+        if not (flagged_only and is_valid):
+            path = os.path.join(out_dir, f"participant_{pid}.{fmt}")
+            viz.render_dashboard(_worker["shares"], _worker["commitments"], pid, path, is_valid=is_valid)
+        results.append({"participant": pid, "valid": is_valid, "path": path})
+    return results
+
+def export_dashboards(shares, commitments, out_dir, participant_ids=None, flagged_only=False,
+                      fmt='png', workers=None, chunk_size=64, engine=None):
+    """
+    Renders one verification dashboard per participant to 'out_dir', headless.
+
+    Args:
+        shares (list): [(i, y_i), ...] as returned by Dealer.distribute_secret.
+        commitments (list): The dealer's public commitments.
+        participant_ids (list): Which participants to render (default: all).
+        flagged_only (bool): Only render participants whose share fails verify_share.
+        fmt (str): 'png' or 'svg'.
+        workers (int): Process count (default: CPU count). 1 renders in this process.
+        chunk_size (int): Participants handed to a worker per task.
+
+    Returns:
+        list: One { 'participant', 'valid', 'path' } dict per participant, in order.
+              'path' is None for participants that were not rendered.
+    """
+    if fmt not in ('png', 'svg'):
+        raise ValueError(f"Unsupported format '{fmt}' (expected 'png' or 'svg')")
+    if engine is None:
+        from src.vss_core.crypto_engine import get_engine
+        engine = get_engine()
+    if participant_ids is None:
+        participant_ids = [pid for pid, _ in shares]
+
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = [participant_ids[i:i + chunk_size] for i in range(0, len(participant_ids), chunk_size)]
+
+    if workers == 1:
+        _init_worker(shares, commitments, engine)
+        try:
+            return [r for chunk in chunks for r in _render_chunk(chunk, out_dir, fmt, flagged_only)]
+        finally:
+            _worker.pop("viz").close()
+            _worker.clear()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(shares, commitments, engine)) as pool:
+        futures = [pool.submit(_render_chunk, chunk, out_dir, fmt, flagged_only) for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from src.vss_core.protocol import Dealer
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else "dashboards"
+
+    dealer = Dealer(3, n)
+    data = dealer.distribute_secret()
+
+    print(f"[+] Rendering {n} dashboards to '{out_dir}'...")
+    start = time.perf_counter()
+    report = export_dashboards(data['shares'], data['commitments'], out_dir, engine=dealer.engine)
+    elapsed = time.perf_counter() - start
+
+    flagged = [r['participant'] for r in report if not r['valid']]
+    print(f"[+] Done in {elapsed:.2f}s ({n / elapsed:.1f} dashboards/s). Flagged: {flagged or 'none'}")
@@ -1,50 +1,53 @@
+import os
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
 
 class Visualizer:
+    # Toy polynomial for visuals: real crypto numbers are too big to plot
+    TOY_COEFFS = [10, 2, -0.5]
+
     def __init__(self, engine):
         self.engine = engine
+        self.fig = None
+        self._artists = None
+        self._num_shares = None
+        self._background = None
+
+    def _toy_curve(self, x, num_shares):
+        """Evaluates the toy polynomial, stretched so its shape is the same for any committee size."""
+        u = x * 5.0 / max(num_shares, 5)
+        return self.TOY_COEFFS[0] + self.TOY_COEFFS[1]*u + self.TOY_COEFFS[2]*(u**2)
 
-    def show_grand_dashboard(self, secret, coefficients, shares, participant_id):
+    def _build_dashboard(self, fig, num_shares):
         """
-        Creates a 2-panel 'Grandiose' Dashboard:
-        1. Top: The Polynomial (Shamir's Logic) - Visualizing the secret.
-        2. Bottom: The Verification (Feldman's Logic) - Visualizing the integrity check.
+        Draws everything that does not depend on the participant onto 'fig'
+        and keeps handles to the artists that do, so they can be updated in place.
         """
-        # Create the figure
-        fig = plt.figure(figsize=(12, 10))
-        fig.suptitle(f"Verifiable Secret Sharing Protocol: Participant {participant_id}", 
-                     fontsize=16, fontweight='bold', color='navy')
+        toy_secret = self.TOY_COEFFS[0]
 
         # --- PANEL 1: THE POLYNOMIAL (SHAMIR) ---
         ax1 = fig.add_subplot(2, 1, 1)
-        
+
         # 1. Generate a smooth curve for the polynomial
-        # We use a 'Toy' polynomial for visuals because real crypto numbers are too big to plot
-        x = np.linspace(0, 6, 100)
-        # Toy polynomial: y = secret + a1*x + a2*x^2 (scaled down for visuals)
-        toy_secret = 10
-        toy_coeffs = [toy_secret, 2, -0.5] 
-        y = toy_coeffs[0] + toy_coeffs[1]*x + toy_coeffs[2]*(x**2)
-        
-        ax1.plot(x, y, label='Secret Polynomial f(x)', color='purple', linewidth=2)
-        
+        x = np.linspace(0, num_shares + 1, 100)
+        ax1.plot(x, self._toy_curve(x, num_shares), label='Secret Polynomial f(x)', color='purple', linewidth=2)
+
         # 2. Plot The Secret (y-intercept at x=0)
         ax1.scatter([0], [toy_secret], color='red', s=200, zorder=5, label='The Secret f(0)')
         ax1.annotate('The Secret', xy=(0, toy_secret), xytext=(0.5, toy_secret+5),
                      arrowprops=dict(facecolor='black', shrink=0.05))
 
         # 3. Plot The Shares (Points on the curve)
-        share_xs = [1, 2, 3, 4, 5]
-        share_ys = [toy_coeffs[0] + toy_coeffs[1]*sx + toy_coeffs[2]*(sx**2) for sx in share_xs]
-        
-        # Highlight THIS participant's share
-        target_x = participant_id
-        target_y = share_ys[participant_id-1]
-        
-        ax1.scatter(share_xs, share_ys, color='cyan', s=100, edgecolor='black', label='Distributed Shares')
-        ax1.scatter([target_x], [target_y], color='blue', s=300, edgecolor='gold', linewidth=3, 
-                    label=f'Your Share f({target_x})')
+        share_xs = np.arange(1, num_shares + 1)
+        ax1.scatter(share_xs, self._toy_curve(share_xs, num_shares), color='cyan', s=100,
+                    edgecolor='black', label='Distributed Shares')
+
+        # Highlight THIS participant's share (moved by _update_dashboard)
+        target = ax1.scatter([1], [self._toy_curve(1, num_shares)], color='blue', s=300,
+                             edgecolor='gold', linewidth=3, label='Your Share')
 
         ax1.set_title("Layer 1: Shamir's Secret Sharing (The Logic)", fontsize=12, fontweight='bold')
         ax1.set_xlabel("Participant ID (x)")
@@ -54,37 +57,145 @@ class Visualizer:
 
         # --- PANEL 2: THE VERIFICATION (FELDMAN) ---
         ax2 = fig.add_subplot(2, 1, 2)
-        
+
         # Visualizing the equation: Share * G == Sum(Commitments)
-        # We represent this as two bars reaching the same height (Integrity Match)
-        
+        # Two bars reach the same height when verify_share accepts the share
         categories = ['Your Calculation (LHS)', 'Public Commitments (RHS)']
-        values = [100, 100] # They match if valid
-        colors = ['blue', 'gold']
-        
-        bars = ax2.bar(categories, values, color=colors, alpha=0.7, width=0.5)
-        
-        # Add visual "Lock" icon
-        ax2.text(0.5, 50, "✅ MATCH", ha='center', va='center', fontsize=20, 
-                 fontweight='bold', color='white', bbox=dict(boxstyle="round,pad=0.5", fc="green", alpha=0.8))
+        bars = ax2.bar(categories, [100, 100], color=['blue', 'gold'], alpha=0.7, width=0.5)
+
+        verdict = ax2.text(0.5, 50, "", ha='center', va='center', fontsize=20,
+                           fontweight='bold', color='white', bbox=dict(boxstyle="round,pad=0.5", fc="green", alpha=0.8))
 
         # Annotations explaining the math
         ax2.text(0, 110, r"$s_i \cdot G$", ha='center', fontsize=14, color='blue')
         ax2.text(1, 110, r"$\sum (C_j \cdot i^j)$", ha='center', fontsize=14, color='darkgoldenrod')
-        
+
         ax2.set_ylim(0, 130)
         ax2.set_title("Layer 2: Feldman's Verification (The Proof)", fontsize=12, fontweight='bold')
         ax2.set_yticks([]) # Hide numbers, abstract concept
-        
-        # Add explanatory text box
-        desc = (
-            "HOW IT WORKS:\n"
-            "1. You received a point on the curve (Blue Dot).\n"
-            "2. You multiplied it by the Generator G (LHS).\n"
-            "3. You checked it against the Public 'Receipts' (RHS).\n"
-            "4. Since the bars match, the Dealer provided a valid share."
-        )
-        plt.figtext(0.5, 0.02, desc, ha="center", fontsize=10, bbox={"facecolor":"lightyellow", "alpha":0.5, "pad":5})
-
-        plt.tight_layout(rect=[0, 0.05, 1, 0.95])
-        plt.show()
\ No newline at end of file
+
+        title = fig.suptitle("", fontsize=16, fontweight='bold', color='navy')
+        desc = fig.text(0.5, 0.02, "", ha="center", fontsize=10,
+                        bbox={"facecolor":"lightyellow", "alpha":0.5, "pad":5})
+
+        fig.tight_layout(rect=[0, 0.05, 1, 0.95])
+        # The layout is final now; leaving the engine attached makes every savefig draw twice
+        fig.set_layout_engine(None)
+
+        self._artists = {"title": title, "target": target, "bars": bars,
+                         "verdict": verdict, "desc": desc}
+        self._num_shares = num_shares
+        self._background = None
+
+    def _dynamic_artists(self):
+        """The artists _update_dashboard touches, in drawing order."""
+        a = self._artists
+        return [a["title"], a["target"], *a["bars"], a["verdict"], a["desc"]]
+
+    def _save_blitted_png(self, path):
+        """
+        Saves the figure by restoring a cached render of the static parts and
+        drawing only the per-participant artists on top (PNG only).
+        """
+        canvas = self.fig.canvas
+        if self._background is None:
+            for artist in self._dynamic_artists():
+                artist.set_animated(True)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+
+        canvas.restore_region(self._background)
+        for artist in self._dynamic_artists():
+            self.fig.draw_artist(artist)
+        # Opaque RGB at a fast zlib level: report PNGs are written once and rarely re-read
+        rgb = np.ascontiguousarray(np.asarray(canvas.buffer_rgba())[..., :3])
+        Image.fromarray(rgb).save(path, compress_level=1)
+
+    def _update_dashboard(self, participant_id, is_valid):
+        """Points the already-built dashboard at one participant and their verification result."""
+        a = self._artists
+        a["title"].set_text(f"Verifiable Secret Sharing Protocol: Participant {participant_id}")
+        a["target"].set_offsets([[participant_id, self._toy_curve(participant_id, self._num_shares)]])
+
+        lhs_bar, rhs_bar = a["bars"]
+        if is_valid:
+            lhs_bar.set_height(100)
+            lhs_bar.set_color('blue')
+            a["verdict"].set_text("[OK] MATCH")
+            a["verdict"].get_bbox_patch().set_facecolor('green')
+            a["desc"].set_text(
+                "HOW IT WORKS:\n"
+                "1. You received a point on the curve (Blue Dot).\n"
+                "2. You multiplied it by the Generator G (LHS).\n"
+                "3. You checked it against the Public 'Receipts' (RHS).\n"
+                "4. Since the bars match, the Dealer provided a valid share."
+            )
+        else:
+            lhs_bar.set_height(70)
+            lhs_bar.set_color('red')
+            a["verdict"].set_text("[X] MISMATCH")
+            a["verdict"].get_bbox_patch().set_facecolor('red')
+            a["desc"].set_text(
+                "FRAUD ALERT:\n"
+                "1. You received a point on the curve (Blue Dot).\n"
+                "2. You multiplied it by the Generator G (LHS).\n"
+                "3. It does NOT match the Public 'Receipts' (RHS).\n"
+                "4. The Dealer provided an invalid share: reject it."
+            )
+        rhs_bar.set_height(100)
+
+    def show_grand_dashboard(self, secret, coefficients, shares, participant_id, commitments=None):
+        """
+        Creates a 2-panel 'Grandiose' Dashboard:
+        1. Top: The Polynomial (Shamir's Logic) - Visualizing the secret.
+        2. Bottom: The Verification (Feldman's Logic) - Visualizing the integrity check.
+
+        If 'commitments' are given, the bottom panel shows the real result of
+        verify_share for this participant; otherwise the share is shown as valid.
+        """
+        share_val = dict(shares)[participant_id]
+        is_valid = True
+        if commitments is not None:
+            is_valid = self.engine.verify_share(participant_id, share_val, commitments)
+
+        fig = plt.figure(figsize=(12, 10))
+        self._build_dashboard(fig, len(shares))
+        self._update_dashboard(participant_id, is_valid)
+        plt.show()
+
+    def render_dashboard(self, shares, commitments, participant_id, path, is_valid=None):
+        """
+        Headless variant of show_grand_dashboard: saves the dashboard to 'path'
+        (format taken from the extension). The figure is built once and reused,
+        so rendering many participants only updates a handful of artists.
+        PNGs are blitted on top of a cached background; other formats are saved normally.
+        The figure has its own Agg canvas and is never registered with pyplot, so the
+        caller's backend is untouched; call close() when done rendering.
+
+        Returns:
+            bool: The verification result that was plotted.
+        """
+        if is_valid is None:
+            is_valid = self.engine.verify_share(participant_id, dict(shares)[participant_id], commitments)
+
+        if self.fig is None or self._num_shares != len(shares):
+            self.fig = Figure(figsize=(12, 10))
+            FigureCanvasAgg(self.fig)
+            self._build_dashboard(self.fig, len(shares))
+
+        self._update_dashboard(participant_id, is_valid)
+        if os.path.splitext(path)[1].lower() == '.png':
+            self._save_blitted_png(path)
+        else:
+            for artist in self._dynamic_artists():
+                artist.set_animated(False)
+            self._background = None
+            self.fig.savefig(path)
+        return is_valid
+
+    def close(self):
+        """Releases the figure kept by render_dashboard."""
+        self.fig = None
+        self._artists = None
+        self._num_shares = None
+        self._background = None
@@ -1,19 +1,48 @@
+import os
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 class StoryVisualizer:
-    def __init__(self):
+    def __init__(self, output_dir=None, fmt='png'):
+        """
+        Args:
+            output_dir (str): If given, stages are saved there (headless)
+                              instead of opened with plt.show().
+            fmt (str): File format for saved stages ('png' or 'svg').
+        """
         self.fig = None
         self.ax = None
+        self.output_dir = output_dir
+        self.fmt = fmt
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
 
     def _setup_figure(self, title):
-        if self.fig:
-            plt.close(self.fig)
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        self.fig.canvas.manager.set_window_title(title)
+        if self.output_dir:
+            # Headless: one Agg figure outside pyplot, reused for every stage, so the
+            # caller's backend and pyplot's figure list are left alone
+            if self.fig is None:
+                self.fig = Figure(figsize=(12, 8))
+                FigureCanvasAgg(self.fig)
+            self.fig.clear()
+            self.ax = self.fig.add_subplot(1, 1, 1)
+        else:
+            if self.fig:
+                plt.close(self.fig)
+            self.fig, self.ax = plt.subplots(figsize=(12, 8))
+            self.fig.canvas.manager.set_window_title(title)
         self.ax.set_title(title, fontsize=18, fontweight='bold', color='navy', pad=20)
         self.ax.axis('off')
 
+    def _finish(self, name):
+        """Shows the stage, or saves it as '<name>.<fmt>' in headless mode."""
+        if self.output_dir:
+            self.fig.savefig(os.path.join(self.output_dir, f"{name}.{self.fmt}"))
+        else:
+            plt.show()
+
     def plot_stage_1_the_secret(self, secret, coefficients):
         """STAGE 1: The Polynomial (Shamir)"""
         self._setup_figure("Stage 1: The Hidden World (The Polynomial)")
@@ -37,7 +66,7 @@ class StoryVisualizer:
         
         self.ax.legend(loc='upper right')
         self.ax.grid(True, alpha=0.3)
-        plt.show()
+        self._finish("stage_1_the_secret")
 
     def plot_stage_2_the_oneway_mirror(self):
         """STAGE 2: The One-Way Mirror (Discrete Log)"""
@@ -60,7 +89,7 @@ class StoryVisualizer:
 
         self.ax.text(5, 3.5, "[X] CANNOT GO BACK", ha='center', fontsize=16, fontweight='bold', 
                      bbox=dict(facecolor='mistyrose', edgecolor='red', boxstyle='round'))
-        plt.show()
+        self._finish("stage_2_the_oneway_mirror")
 
     def plot_stage_3_the_equation(self):
         """STAGE 3: The Equation"""
@@ -78,7 +107,7 @@ class StoryVisualizer:
 
         self.ax.text(8, 6, r"$\sum C_j \cdot i^j$", fontsize=40, color='green', ha='center')
         self.ax.text(8, 4.5, "Combination of \n Public Commitments", ha='center', color='green', fontsize=12)
-        plt.show()
+        self._finish("stage_3_the_equation")
 
     def plot_stage_4_the_proof(self):
         """STAGE 4: Valid Proof"""
@@ -100,7 +129,7 @@ class StoryVisualizer:
         
         self.ax.set_ylim(0, 13)
         self.ax.set_yticks([]) 
-        plt.show()
+        self._finish("stage_4_the_proof")
 
     def plot_stage_5_the_attack(self):
         """STAGE 5: The Attack Simulation (Tampered Share)"""
@@ -133,7 +162,7 @@ class StoryVisualizer:
         
         self.ax.set_ylim(0, 14)
         self.ax.set_yticks([]) 
-        plt.show()
+        self._finish("stage_5_the_attack")
 
     def plot_stage_6_threshold(self, secret, coefficients):
         """STAGE 6: Threshold Cryptography (Reconstruction)"""
@@ -167,4 +196,4 @@ class StoryVisualizer:
                      bbox=dict(facecolor='lightyellow', boxstyle='round'), fontsize=12)
         
         self.ax.grid(True, alpha=0.2)
-        plt.show()
\ No newline at end of file
+        self._finish("stage_6_threshold")
\ No newline at end of file
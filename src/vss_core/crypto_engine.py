@@ -1,7 +1,33 @@
 from tinyec import registry
-import secrets
+from tinyec.ec import Inf, Point
+
+# Process-wide engines, one per curve (see get_engine)
+_ENGINES = {}
+
+def get_engine(curve_name='secp256r1'):
+    """
+    Returns the shared CryptoEngine for 'curve_name', creating it on first use.
+    Every Dealer and verifier in the process then reuses the same curve lookup
+    and the same lazily built precomputation tables.
+    """
+    engine = _ENGINES.get(curve_name)
+    if engine is None:
+        engine = _ENGINES.setdefault(curve_name, CryptoEngine(curve_name))
+    return engine
 
 class CryptoEngine:
+    # Width (in bits) of the digit windows used by the multi-scalar routines.
+    # 4 bits keeps each comb table at 64 windows of 16 points, built once per engine.
+    WINDOW_BITS = 4
+
+    # Fixed-base calls answered without the comb table before it is built. The table
+    # costs ~1,000 additions, about what 4 table-less multiplications lose against it,
+    # so a short-lived verifier never pays for it and a busy one pays at most twice.
+    COMB_WARMUP = 4
+    # Likewise for the joint G/H comb table: its ~14,400 additions beat the two
+    # separate G and H tables by ~64 additions per call, i.e. after ~224 calls.
+    JOINT_WARMUP = 224
+
     def __init__(self, curve_name='secp256r1'):
         """
         Initializes the Elliptic Curve Engine.
@@ -11,8 +37,18 @@ class CryptoEngine:
         self.G = self.curve.g
         self.n = self.curve.field.n  # The order of the subgroup
 
+        # Precomputed tables are only built the first time they are needed
+        self._H = None
+        self._g_table = None
+        self._h_table = None
+        self._joint_table = None
+        self._comb_calls = 0
+        self._joint_calls = 0
+
     def generate_secret(self):
         """Generates a random secret (scalar) within the field order."""
+        # Imported here: verify-only processes never need it, and it is slow to load
+        import secrets
         return secrets.randbelow(self.n)
 
     def get_commitment(self, scalar):
@@ -20,35 +56,194 @@ class CryptoEngine:
         Computes the Public Commitment: C = scalar * G
         This is the 'One-Way Function' that secures the Verifiable Secret Sharing.
         """
-        return scalar * self.G
+        return self.fixed_base_mul(scalar)
+
+    # --- Point helpers -------------------------------------------------
+    # tinyec's Inf cannot be added to another Inf, so internally we use
+    # None for the identity and only convert back when handing a result out.
+
+    def _add(self, p, q):
+        if p is None:
+            return q
+        if q is None:
+            return p
+        r = p + q
+        return None if isinstance(r, Inf) else r
+
+    def _neg(self, p):
+        return None if p is None else Point(self.curve, p.x, -p.y % self.curve.field.p)
+
+    def _to_point(self, p):
+        return Inf(self.curve) if p is None else p
+
+    def _from_point(self, p):
+        return None if isinstance(p, Inf) else p
+
+    @property
+    def H(self):
+        """
+        The second generator for Pedersen commitments.
+        Derived by hashing G onto the curve, so nobody knows log_G(H).
+        """
+        if self._H is None:
+            coord_len = (self.curve.field.p.bit_length() + 7) // 8
+            self._H = self._hash_to_point(b"VSS-Pedersen-H" + self.G.x.to_bytes(coord_len, 'big'))
+        return self._H
+
+    def _hash_to_point(self, seed):
+        """Try-and-increment: hash to an x-coordinate until it lands on the curve."""
+        import hashlib
+        p = self.curve.field.p
+        if p % 4 != 3:
+            raise ValueError(f"Cannot derive H on curve '{self.curve.name}' (needs p = 3 mod 4)")
+
+        counter = 0
+        while True:
+            digest = hashlib.sha256(seed + counter.to_bytes(4, 'big')).digest()
+            x = int.from_bytes(digest, 'big') % p
+            y_squared = (pow(x, 3, p) + self.curve.a * x + self.curve.b) % p
+            y = pow(y_squared, (p + 1) // 4, p)
+            if (y * y) % p == y_squared and y != 0:
+                # Clear the cofactor so H lives in the same subgroup as G
+                return self.curve.field.h * Point(self.curve, x, y)
+            counter += 1
+
+    # --- Multi-scalar multiplication -----------------------------------
+
+    def _build_comb_table(self, base):
+        """
+        Precomputes T[k][d] = d * 2^(w*k) * base for every w-bit window k.
+        With it, scalar * base needs one addition per window and no doublings.
+        """
+        w = self.WINDOW_BITS
+        table = []
+        for _ in range(-(-self.n.bit_length() // w)):
+            row = [None, base]
+            for _ in range(2, 1 << w):
+                row.append(self._add(row[-1], base))
+            table.append(row)
+            # Next window's base: 2^w * base = (2^w - 1) * base + base
+            base = self._add(row[-1], base)
+        return table
+
+    def _get_fixed_base_table(self):
+        if self._g_table is None:
+            self._g_table = self._build_comb_table(self.G)
+        return self._g_table
+
+    def _get_h_table(self):
+        if self._h_table is None:
+            self._h_table = self._build_comb_table(self.H)
+        return self._h_table
+
+    def _get_joint_table(self):
+        """
+        Precomputes T[k][(da << w) | db] = da * 2^(w*k) * G + db * 2^(w*k) * H, so
+        a*G + b*H costs one addition per window, like a Feldman commitment.
+        At w = 4 that is 64 windows of 256 points (about 16k points, a few MB).
+        """
+        if self._joint_table is None:
+            self._joint_table = [[self._add(g, h) for g in g_row for h in h_row]
+                                 for g_row, h_row in zip(self._get_fixed_base_table(), self._get_h_table())]
+            # Only the joint table is read from now on
+            self._h_table = None
+        return self._joint_table
+
+    def warm_up(self, pedersen=False):
+        """Builds the precomputed tables now, e.g. at the start of a long-running dealer."""
+        self._get_fixed_base_table()
+        if pedersen:
+            self._get_joint_table()
+
+    def _comb_sum(self, table, scalar, acc=None):
+        w = self.WINDOW_BITS
+        mask = (1 << w) - 1
+        for k, row in enumerate(table):
+            digit = (scalar >> (k * w)) & mask
+            if digit:
+                acc = self._add(acc, row[digit])
+        return acc
+
+    def fixed_base_mul(self, scalar):
+        """
+        Computes scalar * G. The first COMB_WARMUP calls use a plain windowed
+        multiplication; after that the cached comb table for G is built and used.
+        """
+        scalar %= self.n
+        if self._g_table is None:
+            self._comb_calls += 1
+            if self._comb_calls <= self.COMB_WARMUP:
+                return self.multi_scalar_mul([scalar], [self.G])
+        return self._to_point(self._comb_sum(self._get_fixed_base_table(), scalar))
+
+    def double_base_mul(self, a, b):
+        """
+        Computes a*G + b*H from the joint G/H comb table: one addition per window
+        and no doublings, the same work as fixed_base_mul. Until JOINT_WARMUP calls
+        have been made, it falls back to a windowed multiplication (first
+        COMB_WARMUP calls) and then to the separate G and H comb tables.
+        """
+        a %= self.n
+        b %= self.n
+        if self._joint_table is None:
+            self._joint_calls += 1
+            if self._joint_calls <= self.COMB_WARMUP:
+                return self.multi_scalar_mul([a, b], [self.G, self.H])
+            if self._joint_calls <= self.JOINT_WARMUP:
+                acc = self._comb_sum(self._get_fixed_base_table(), a)
+                return self._to_point(self._comb_sum(self._get_h_table(), b, acc))
+
+        w = self.WINDOW_BITS
+        mask = (1 << w) - 1
+        acc = None
+        for k, row in enumerate(self._get_joint_table()):
+            digit = (((a >> (k * w)) & mask) << w) | ((b >> (k * w)) & mask)
+            if digit:
+                acc = self._add(acc, row[digit])
+        return self._to_point(acc)
+
+    def multi_scalar_mul(self, scalars, points):
+        """
+        Computes Sum( k_j * P_j ) for arbitrary points (Straus' interleaving).
+        All terms share one chain of doublings, sized to the largest scalar.
+        """
+        w = self.WINDOW_BITS
+        mask = (1 << w) - 1
+        scalars = [k % self.n for k in scalars]
+
+        # Small per-point tables [0, P, 2P, ...], only as long as the scalar needs
+        tables = []
+        for k, point in zip(scalars, points):
+            table = [None, point]
+            for _ in range(2, min(mask, k) + 1):
+                table.append(self._add(table[-1], point))
+            tables.append(table)
+
+        num_windows = -(-max((k.bit_length() for k in scalars), default=0) // w)
+        acc = None
+        for window in reversed(range(num_windows)):
+            for _ in range(w):
+                acc = self._add(acc, acc)
+            for k, table in zip(scalars, tables):
+                digit = (k >> (window * w)) & mask
+                if digit:
+                    acc = self._add(acc, table[digit])
+        return self._to_point(acc)
+
+    # --- Feldman -------------------------------------------------------
 
     def compute_verification_point(self, share_index, commitments):
         """
         Computes the RHS of Feldman's Equation:
         Prod( C_j ^ (i^j) )  -> which in additive ECC is: Sum( (i^j) * C_j )
-        
+
         Args:
             share_index (int): The 'x' value of the participant (i).
             commitments (list): List of Points [C_0, C_1, ... C_t-1].
         """
-        # Start with the Point at Infinity (Identity element)
-        # Note: tinyec doesn't expose a clean 'Infinity' object easily, 
-        # so we initialize with the first term and add the rest.
-        
-        # Term 0: (i^0) * C_0 = 1 * C_0 = C_0
-        result_point = commitments[0]
-
-        for j in range(1, len(commitments)):
-            # Calculate weight: i^j mod n
-            weight = pow(share_index, j, self.n)
-            
-            # Calculate term: weight * C_j
-            term = weight * commitments[j]
-            
-            # Add to total: result + term
-            result_point = result_point + term
-            
-        return result_point
+        # Weights i^j mod n; all terms are accumulated in one joint multiplication
+        weights = [pow(share_index, j, self.n) for j in range(len(commitments))]
+        return self.multi_scalar_mul(weights, commitments)
 
     def verify_share(self, share_index, share_value, commitments):
         """
@@ -57,10 +252,58 @@ class CryptoEngine:
         RHS: Sum( (i^j) * C_j )
         """
         # 1. Compute LHS (Left Hand Side)
-        lhs = share_value * self.G
+        lhs = self.fixed_base_mul(share_value)
 
         # 2. Compute RHS (Right Hand Side)
         rhs = self.compute_verification_point(share_index, commitments)
 
         # 3. Compare coordinates
-        return lhs == rhs
\ No newline at end of file
+        return lhs == rhs
+
+    def batch_verify_shares(self, shares, commitments):
+        """
+        Verifies all shares of one dealing with a single random linear combination:
+        Sum( r_i * s_i ) * G == Sum_j( Sum_i( r_i * i^j ) * C_j )
+        The random weights r_i keep a dealer from making bad shares cancel out.
+
+        Args:
+            shares (list): [(i, s_i), ...] to check against the same commitments.
+
+        Returns:
+            list: Indices of the invalid shares ([] if all are valid). Individual
+                  checks are only run when the combined check fails.
+        """
+        import secrets
+
+        lhs_scalar = 0
+        weights = [0] * len(commitments)
+        for share_index, share_value in shares:
+            r = secrets.randbits(128)
+            lhs_scalar += r * share_value
+            power = r
+            for j in range(len(commitments)):
+                weights[j] += power
+                power = power * share_index % self.n
+
+        if self.fixed_base_mul(lhs_scalar) == self.multi_scalar_mul(weights, commitments):
+            return []
+        return [i for i, s in shares if not self.verify_share(i, s, commitments)]
+
+    # --- Pedersen ------------------------------------------------------
+
+    def get_pedersen_commitment(self, scalar, blinding):
+        """
+        Computes the hiding commitment: C = scalar * G + blinding * H
+        Unlike Feldman's C = scalar * G, this reveals nothing about 'scalar'.
+        """
+        return self.double_base_mul(scalar, blinding)
+
+    def verify_pedersen_share(self, share_index, share_value, blinding_value, commitments):
+        """
+        Pedersen Verification.
+        LHS: share_value * G + blinding_value * H
+        RHS: Sum( (i^j) * C_j )   (same combination as Feldman)
+        """
+        lhs = self.double_base_mul(share_value, blinding_value)
+        rhs = self.compute_verification_point(share_index, commitments)
+        return lhs == rhs
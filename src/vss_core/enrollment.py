@@ -0,0 +1,179 @@
+from src.vss_core.crypto_engine import get_engine
+from src.vss_core.reconstruction import lagrange_coefficients
+
+class PublicShareCache:
+    """
+    Caches the public share points P(i) = Sum( i^j * C_j ) = f(i) * G of one dealing,
+    i.e. the RHS of the verification equation for every participant index.
+
+    P is a degree t-1 polynomial in i, so its forward differences
+    [P(x), dP(x), ..., d^(t-1)P(x)] step from x to x+1 with t-1 point additions
+    and no scalar multiplications. Participants joining at the next indices are
+    therefore checked with one fixed-base multiplication (the LHS) plus O(t) additions.
+    """
+    def __init__(self, commitments, engine=None, next_index=1, pedersen=False):
+        """
+        Args:
+            commitments (list): The dealing's published [C_0, ..., C_t-1] (unchanged by enrollment).
+            engine (CryptoEngine): The elliptic curve math wrapper (default: the shared engine).
+            next_index (int): Where sequential lookups will start, e.g. n+1 to enroll
+                              members after an n-member dealing.
+            pedersen (bool): The commitments are Pedersen's, so shares need a blinding value.
+        """
+        self.commitments = commitments
+        self.engine = engine if engine else get_engine()
+        self.next_index = next_index
+        self.pedersen = pedersen
+        self._points = {}
+        self._diffs = None  # Forward differences at index self._x
+        self._x = None
+
+    def _direct(self, index):
+        point = self.engine.compute_verification_point(index, self.commitments)
+        return self.engine._from_point(point)
+
+    def _start_differences(self):
+        """Builds the difference table from t direct evaluations ending just before next_index."""
+        engine = self.engine
+        t = len(self.commitments)
+        start = self.next_index - t
+        row = [self._direct(x) for x in range(start, start + t)]
+
+        self._diffs = []
+        while row:
+            self._diffs.append(row[0])
+            row = [engine._add(row[m + 1], engine._neg(row[m])) for m in range(len(row) - 1)]
+        self._x = start
+        self._points[start] = self._diffs[0]
+        for _ in range(t - 1):
+            self._advance()
+
+    def _advance(self):
+        """Moves the difference table from x to x+1 and caches P(x+1)."""
+        diffs = self._diffs
+        for k in range(len(diffs) - 1):
+            diffs[k] = self.engine._add(diffs[k], diffs[k + 1])
+        self._x += 1
+        self._points[self._x] = diffs[0]
+
+    def public_share_point(self, index):
+        """Returns P(index) = f(index) * G, computing and caching it if needed."""
+        if index not in self._points:
+            if self._diffs is None:
+                self._start_differences()
+
+            t = len(self.commitments)
+            gap = index - self._x
+            # Stepping costs t-1 additions per index. A direct evaluation costs about
+            # (t-1) * bit_length(index) doublings plus its window tables
+            direct_cost = (t - 1) * index.bit_length() + 16 * t
+            if 0 < gap and gap * (t - 1) <= direct_cost:
+                for _ in range(gap):
+                    self._advance()
+            else:
+                self._points[index] = self._direct(index)
+        return self.engine._to_point(self._points[index])
+
+    def verify_share(self, index, share_value, blinding_value=None):
+        """
+        Checks a (possibly newly enrolled) share against the unchanged commitments.
+        Pass 'blinding_value' for Pedersen dealings.
+        """
+        if self.pedersen and blinding_value is None:
+            raise ValueError("Pedersen dealing: a blinding value is needed to verify a share")
+        if blinding_value is None:
+            lhs = self.engine.fixed_base_mul(share_value)
+        else:
+            lhs = self.engine.double_base_mul(share_value, blinding_value)
+        return lhs == self.public_share_point(index)
+
+def _pairwise_mask(seed, new_index, order, blinding=False):
+    """The mask two helpers derive from their shared seed for one enrollment."""
+    import hashlib
+    # Share and blinding contributions get independent masks: reusing one would
+    # let their difference reveal lambda_i * (s_i - r_i)
+    label = b"VSS-enroll-blinding-mask|" if blinding else b"VSS-enroll-mask|"
+    # 512 bits reduced mod order keeps the mask statistically uniform
+    digest = hashlib.sha512(label + seed + b"|" + str(new_index).encode()).digest()
+    return int.from_bytes(digest, 'big') % order
+
+def helper_contribution(own_share, helper_xs, new_index, pairwise_mask_seeds, order, blinding=False):
+    """
+    Share-to-new-index protocol, run by each of t existing holders on its own,
+    without the dealer.
+
+    Helper i's part of f(new_index) is lambda_i(new_index) * s_i. Each pair of
+    helpers shares a secret seed, from which both derive the same mask; the
+    helper with the smaller index adds it and the other subtracts it. The masks
+    cancel in the sum, and no single contribution reveals the helper's share.
+    A helper only ever sees its own share. In a Pedersen dealing each helper
+    runs this a second time on its blinding share (x_i, r_i) with blinding=True.
+
+    Args:
+        own_share (tuple): This helper's (x_i, s_i).
+        helper_xs (list): Indices of all t helpers, including x_i.
+        new_index (int): The index being enrolled.
+        pairwise_mask_seeds (dict): {x_j: seed bytes} shared with every other helper
+                                    j over a private channel.
+        order (int): Field order of the shares (CryptoEngine.n).
+        blinding (bool): 'own_share' is a Pedersen blinding share.
+
+    Returns:
+        tuple: (x_i, masked contribution), to send to the new member.
+    """
+    x_i, s_i = own_share
+    if new_index % order == 0:
+        raise ValueError(f"Invalid participant index {new_index}: f({new_index}) would reveal the secret")
+    if x_i not in helper_xs:
+        raise ValueError(f"Helper {x_i} is not among the helpers {helper_xs}")
+    if new_index in helper_xs:
+        raise ValueError(f"Index {new_index} already belongs to a helper")
+
+    coeffs = lagrange_coefficients(helper_xs, order, at=new_index)
+    contribution = coeffs[helper_xs.index(x_i)] * s_i
+    for x_j in helper_xs:
+        if x_j == x_i:
+            continue
+        if x_j not in pairwise_mask_seeds:
+            raise ValueError(f"Helper {x_i} has no mask seed shared with helper {x_j}")
+        mask = _pairwise_mask(pairwise_mask_seeds[x_j], new_index, order, blinding)
+        contribution += mask if x_i < x_j else -mask
+    return x_i, contribution % order
+
+def combine_contributions(new_index, contributions, cache, blinding_contributions=None):
+    """
+    The new member's side: sums the helpers' contributions into f(new_index)
+    (and r(new_index) for Pedersen) and only accepts the result if it verifies
+    against the dealing's commitments.
+
+    Args:
+        contributions (list): [(x_i, masked contribution), ...] from every helper.
+        cache (PublicShareCache): Built from the dealing's published commitments.
+        blinding_contributions (list): The helpers' blinding contributions (Pedersen only).
+
+    Returns:
+        dict: { 'share': (i, f(i)) } plus 'blinding_share': (i, r(i)) in Pedersen mode,
+              like Dealer.enroll.
+
+    Raises:
+        ValueError: If the combined share does not verify (a helper misbehaved).
+    """
+    order = cache.engine.n
+    if new_index % order == 0:
+        raise ValueError(f"Invalid participant index {new_index}: f({new_index}) would reveal the secret")
+    if cache.pedersen and blinding_contributions is None:
+        raise ValueError("Pedersen dealing: the helpers' blinding contributions are needed too")
+    if not cache.pedersen and blinding_contributions is not None:
+        raise ValueError("Blinding contributions given for a Feldman dealing")
+
+    share_value = sum(c for _, c in contributions) % order
+    blinding_value = None
+    if blinding_contributions is not None:
+        blinding_value = sum(c for _, c in blinding_contributions) % order
+    if not cache.verify_share(new_index, share_value, blinding_value):
+        raise ValueError(f"Combined share for index {new_index} does not match the commitments")
+
+    result = {"share": (new_index, share_value)}
+    if blinding_value is not None:
+        result["blinding_share"] = (new_index, blinding_value)
+    return result
@@ -1,17 +1,25 @@
-from src.vss_core.crypto_engine import CryptoEngine
-import secrets
+from src.vss_core.crypto_engine import get_engine
 
 class Dealer:
-    def __init__(self, threshold, num_shares, engine=None):
+    def __init__(self, threshold, num_shares, engine=None, pedersen=False):
         """
         Args:
             threshold (int): Minimum shares needed to reconstruct (t).
             num_shares (int): Total shares to distribute (n).
-            engine (CryptoEngine): The elliptic curve math wrapper.
+            engine (CryptoEngine): The elliptic curve math wrapper
+                                   (default: the shared secp256r1 engine).
+            pedersen (bool): Use hiding Pedersen commitments instead of Feldman's.
         """
         self.t = threshold
         self.n = num_shares
-        self.engine = engine if engine else CryptoEngine()
+        self.engine = engine if engine else get_engine()
+        self.pedersen = pedersen
+
+        # Kept from the last dealing so late joiners can be enrolled without re-dealing
+        self._coefficients = None
+        self._blinding_coefficients = None
+        # Indices (mod the field order) that already hold a share of the last dealing
+        self._issued = set()
 
     def generate_polynomial(self, secret):
         """
@@ -25,15 +33,21 @@ class Dealer:
             coefficients.append(random_coeff)
         return coefficients
 
-    def generate_commitments(self, coefficients):
+    def generate_commitments(self, coefficients, blinding_coefficients=None):
         """
         Converts coefficients into Public Verification Points.
-        C_i = coefficient_i * G
+        Feldman:  C_i = coefficient_i * G
+        Pedersen: C_i = coefficient_i * G + blinding_i * H
         """
         commitments = []
-        for coeff in coefficients:
-            comm = self.engine.get_commitment(coeff)
-            commitments.append(comm)
+        if blinding_coefficients is None:
+            for coeff in coefficients:
+                comm = self.engine.get_commitment(coeff)
+                commitments.append(comm)
+        else:
+            for coeff, blind in zip(coefficients, blinding_coefficients):
+                comm = self.engine.get_pedersen_commitment(coeff, blind)
+                commitments.append(comm)
         return commitments
 
     def evaluate_polynomial(self, coefficients, x):
@@ -55,17 +69,24 @@ class Dealer:
         3. Calculate public commitments.
         4. Generate private shares for n participants.
         
+        In Pedersen mode a second random polynomial r(x) blinds the commitments,
+        and each participant also receives their blinding share r(i).
+
         Returns:
             dict: { 'commitments': [...], 'shares': [(1, y1), (2, y2), ...] }
+                  plus 'blinding_shares': [(1, r1), ...] in Pedersen mode.
         """
         if secret_value is None:
             secret_value = self.engine.generate_secret()
 
         # 1 & 2: Polynomial
         coeffs = self.generate_polynomial(secret_value)
+        blinding_coeffs = None
+        if self.pedersen:
+            blinding_coeffs = self.generate_polynomial(self.engine.generate_secret())
 
         # 3: Commitments (The "Receipts")
-        commitments = self.generate_commitments(coeffs)
+        commitments = self.generate_commitments(coeffs, blinding_coeffs)
 
         # 4: Shares (The "Keys")
         shares = []
@@ -73,8 +94,41 @@ class Dealer:
             share_val = self.evaluate_polynomial(coeffs, i)
             shares.append((i, share_val))
 
-        return {
+        self._coefficients = coeffs
+        self._blinding_coefficients = blinding_coeffs
+        self._issued = set(range(1, self.n + 1))
+
+        result = {
             "commitments": commitments,
             "shares": shares,
             "secret_kept_by_dealer": secret_value  # For debugging/verification
-        }
\ No newline at end of file
+        }
+
+        if self.pedersen:
+            result["blinding_shares"] = [(i, self.evaluate_polynomial(blinding_coeffs, i))
+                                         for i in range(1, self.n + 1)]
+
+        return result
+
+    def enroll(self, new_index):
+        """
+        Issues a share for a participant joining after distribute_secret, from the
+        same polynomial, so the published commitments stay valid for everyone.
+        The new share verifies like any other (see enrollment.PublicShareCache).
+        Each index is issued once per dealing: 1..n at distribution, then one per enroll.
+
+        Returns:
+            dict: { 'share': (i, f(i)) } plus 'blinding_share': (i, r(i)) in Pedersen mode.
+        """
+        if self._coefficients is None:
+            raise ValueError("Nothing to enroll into: call distribute_secret first")
+        if new_index % self.engine.n == 0:
+            raise ValueError(f"Invalid participant index {new_index}: f({new_index}) would reveal the secret")
+        if new_index % self.engine.n in self._issued:
+            raise ValueError(f"Participant index {new_index} already holds a share of this dealing")
+        self._issued.add(new_index % self.engine.n)
+
+        result = {"share": (new_index, self.evaluate_polynomial(self._coefficients, new_index))}
+        if self.pedersen:
+            result["blinding_share"] = (new_index, self.evaluate_polynomial(self._blinding_coefficients, new_index))
+        return result
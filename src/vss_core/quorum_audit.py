@@ -0,0 +1,237 @@
+import random
+import time
+from math import comb
+
+from src.vss_core.reconstruction import reconstruct_secret
+
+def revolving_door(n, t):
+    """
+    Enumerates every t-subset of range(n) in revolving-door (Gray code) order
+    (Knuth, TAOCP 7.2.1.3, Algorithm R).
+
+    Yields the first subset as a sorted list, then one (removed, added) pair
+    per step: each subset differs from the previous one by a single swap.
+    """
+    if not 0 < t <= n:
+        raise ValueError(f"Need 0 < t <= n (got t={t}, n={n})")
+
+    # c[1..t] hold the subset, c[t+1] = n and c[t+2] = 0 are sentinels (c[0] is unused)
+    c = [None] + list(range(t)) + [n, 0]
+    yield c[1:t + 1]
+
+    while True:
+        # R3: Easy case, move c_1 by one
+        if t % 2 == 1:
+            if c[1] + 1 < c[2]:
+                yield c[1], c[1] + 1
+                c[1] += 1
+                continue
+            j, step = 2, 'decrease'
+            if t == 1:
+                return
+        else:
+            if c[1] > 0:
+                yield c[1], c[1] - 1
+                c[1] -= 1
+                continue
+            j, step = 2, 'increase'
+
+        while True:
+            if step == 'decrease':
+                # R4: here c_j = c_{j-1} + 1
+                if c[j] >= j:
+                    yield c[j], j - 2
+                    c[j], c[j - 1] = c[j - 1], j - 2
+                    break
+                j += 1
+                step = 'increase'
+            else:
+                # R5: here c_{j-1} = j - 2
+                if c[j] + 1 < c[j + 1]:
+                    yield j - 2, c[j] + 1
+                    c[j - 1], c[j] = c[j], c[j] + 1
+                    break
+                j += 1
+                if j > t:
+                    return
+                step = 'decrease'
+
+def _random_swaps(n, t, count, rng):
+    """
+    A random walk over t-subsets: starts from a random subset and swaps one
+    random member for one random outsider per step (count subsets in total).
+    Consecutive subsets are correlated and the walk may revisit a subset;
+    audit_quorums counts the distinct ones separately.
+    """
+    positions = list(range(n))
+    rng.shuffle(positions)
+    members, outsiders = positions[:t], positions[t:]
+    yield sorted(members)
+    if not outsiders:
+        return
+
+    for _ in range(count - 1):
+        m = rng.randrange(t)
+        o = rng.randrange(n - t)
+        removed, added = members[m], outsiders[o]
+        members[m], outsiders[o] = added, removed
+        yield removed, added
+
+def audit_quorums(shares, threshold, order, sample=None, seed=None, expected_secret=None, max_examples=5):
+    """
+    Reconstructs f(0) from every threshold-sized quorum of 'shares' (or a
+    random sample of them) and checks that all quorums agree.
+
+    Quorums are visited so that consecutive ones differ by one share. The
+    Lagrange weights are then updated in O(t) per quorum instead of being
+    rebuilt in O(t^2) with t modular inversions.
+
+    Args:
+        shares (list): [(x_i, y_i), ...] as returned by Dealer.distribute_secret.
+        threshold (int): Quorum size t.
+        order (int): Field order of the shares (CryptoEngine.n).
+        sample (int): If given, take this many steps of a random walk over quorums
+                      instead of enumerating all C(n, t) of them. The walk can revisit
+                      a quorum; a sample of C(n, t) or more audits every quorum instead.
+        seed: Seed for the random walk.
+        expected_secret (int): Value every quorum must give (default: the first quorum's).
+        max_examples (int): How many disagreeing quorums to keep in the report.
+
+    Returns:
+        dict: { 'quorums', 'distinct_quorums', 'consistent', 'secret', 'mismatches',
+                'examples', 'elapsed', 'quorums_per_sec' }
+              'quorums' counts reconstructions (walk steps when sampling) and
+              'distinct_quorums' the different quorums among them; 'mismatches'
+              counts distinct disagreeing quorums.
+    """
+    n = len(shares)
+    xs = [x % order for x, _ in shares]
+    ys = [y % order for _, y in shares]
+
+    if sample is not None and sample < 1:
+        raise ValueError(f"Sample size must be positive (got {sample})")
+    if sample is not None and sample >= comb(n, threshold):
+        # Covers t == n too, where the only quorum is everyone
+        sample = None
+
+    if sample is None:
+        steps = revolving_door(n, threshold)
+    else:
+        steps = _random_swaps(n, threshold, sample, random.Random(seed))
+
+    start = time.perf_counter()
+
+    # f(0) = P * Sum( w_i ),  with  P = Prod( x_j )  and  w_i = y_i / (x_i * Prod_{j != i}(x_j - x_i))
+    inv_x = [pow(x, -1, order) for x in xs]
+
+    def fresh_weight(i, others):
+        # Share indices are small, so the denominator stays a small integer until the one inversion
+        den = xs[i]
+        for j in others:
+            den *= xs[j] - xs[i]
+        return ys[i] * pow(den, -1, order) % order
+
+    # ratios[(o, a)][i] = (x_o - x_i) / (x_a - x_i): how w_i changes when o is swapped for a.
+    # A revolving-door walk reuses the same few (o, a) pairs, so rows are cached.
+    ratios = {}
+
+    def ratio_row(o, a):
+        row = ratios.get((o, a))
+        if row is None:
+            row = [(xs[o] - x_i) * pow(xs[a] - x_i, -1, order) % order if i != a else 0
+                   for i, x_i in enumerate(xs)]
+            ratios[(o, a)] = row
+        return row
+
+    members = next(steps)
+    scale = 1
+    for i in members:
+        scale = scale * xs[i] % order
+    w = [0] * n
+    for i in members:
+        w[i] = fresh_weight(i, [j for j in members if j != i])
+
+    secret = scale * sum(w[i] for i in members) % order
+    reference = secret if expected_secret is None else expected_secret % order
+    mismatches = 0
+    examples = []
+    if secret != reference:
+        mismatches += 1
+        examples.append(sorted(xs[i] for i in members))
+
+    member_set = set(members)
+    quorums = 1
+    # The revolving door never repeats a quorum; the random walk can, so it keeps
+    # a bitmask per visited quorum
+    visited = None
+    if sample is not None:
+        mask = sum(1 << i for i in members)
+        visited = {mask}
+
+    for removed, added in steps:
+        member_set.remove(removed)
+
+        # Swapping x_out for x_in turns each remaining denominator term
+        # (x_out - x_i) into (x_in - x_i), and scales P by x_in / x_out
+        row = ratio_row(removed, added)
+        for i in member_set:
+            w[i] = w[i] * row[i] % order
+        w[added] = fresh_weight(added, member_set)
+        w[removed] = 0
+        member_set.add(added)
+        scale = scale * xs[added] * inv_x[removed] % order
+
+        quorums += 1
+        if visited is not None:
+            mask ^= (1 << removed) | (1 << added)
+            if mask in visited:
+                continue
+            visited.add(mask)
+        if scale * sum(w[i] for i in member_set) % order != reference:
+            mismatches += 1
+            if len(examples) < max_examples:
+                examples.append(sorted(xs[i] for i in member_set))
+
+    elapsed = time.perf_counter() - start
+    return {
+        "quorums": quorums,
+        "distinct_quorums": quorums if visited is None else len(visited),
+        "consistent": mismatches == 0,
+        "secret": reference,
+        "mismatches": mismatches,
+        "examples": examples,
+        "elapsed": elapsed,
+        "quorums_per_sec": quorums / elapsed if elapsed > 0 else float('inf'),
+    }
+
+def naive_audit_quorums(shares, threshold, order, quorums):
+    """Recomputes f(0) from scratch for each given quorum; the baseline audit_quorums replaces."""
+    share_map = dict(shares)
+    return [reconstruct_secret([(x, share_map[x]) for x in q], order) for q in quorums]
+
+if __name__ == "__main__":
+    import sys
+    from itertools import combinations, islice
+    from src.vss_core.protocol import Dealer
+
+    t = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    sample = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret()
+    order = dealer.engine.n
+
+    label = f"{sample} sampled" if sample else "all"
+    print(f"[+] Auditing {label} quorums of a {t}-of-{n} dealing...")
+    report = audit_quorums(data['shares'], t, order, sample=sample)
+
+    print(f"    Quorums checked : {report['quorums']} ({report['distinct_quorums']} distinct)")
+    print(f"    Consistent      : {report['consistent']} (secret matches dealer: "
+          f"{report['secret'] == data['secret_kept_by_dealer']})")
+    print(f"    Throughput      : {report['quorums_per_sec']:.0f} quorums/s ({report['elapsed']:.2f}s)")
+
+    baseline = list(islice(combinations(range(1, n + 1), t), 2000))
+    start = time.perf_counter()
+    naive_audit_quorums(data['shares'], t, order, baseline)
+    print(f"    Naive baseline  : {len(baseline) / (time.perf_counter() - start):.0f} quorums/s")
@@ -0,0 +1,27 @@
+def lagrange_coefficients(xs, order, at=0):
+    """
+    Computes the Lagrange basis values at x = 'at' for the given share indices:
+    lambda_i = Prod_{j != i}( (at - x_j) / (x_i - x_j) )  mod order
+    At 0 these recover the secret; at a new index they produce that index's share.
+    """
+    coeffs = []
+    for i, x_i in enumerate(xs):
+        num, den = 1, 1
+        for j, x_j in enumerate(xs):
+            if j != i:
+                num = (num * (at - x_j)) % order
+                den = (den * (x_i - x_j)) % order
+        coeffs.append(num * pow(den, -1, order) % order)
+    return coeffs
+
+def reconstruct_secret(shares, order):
+    """
+    Recovers f(0) from t shares with Lagrange interpolation.
+
+    Args:
+        shares (list): [(x_1, y_1), ..., (x_t, y_t)] with distinct x values.
+        order (int): The field order the shares live in (CryptoEngine.n).
+    """
+    xs = [x for x, _ in shares]
+    coeffs = lagrange_coefficients(xs, order)
+    return sum(c * y for c, (_, y) in zip(coeffs, shares)) % order
@@ -0,0 +1,77 @@
+import os
+import warnings
+import pytest
+import matplotlib
+import matplotlib.pyplot as plt
+from PIL import Image
+from src.vss_core.protocol import Dealer
+from src.visuals.batch_export import export_dashboards
+from src.visuals.plotter import Visualizer
+from src.visuals.story_plotter import StoryVisualizer
+
+def test_export_flagged_dashboards(tmp_path):
+    """Only the tampered participant's dashboard should be rendered in flagged mode."""
+    dealer = Dealer(3, 8)
+    data = dealer.distribute_secret(4242)
+
+    # Corrupt Participant 5
+    victim_id = 5
+    shares = [(pid, (val + 1) % dealer.engine.n if pid == victim_id else val)
+              for pid, val in data['shares']]
+
+    report = export_dashboards(shares, data['commitments'], str(tmp_path),
+                               flagged_only=True, workers=1, engine=dealer.engine)
+
+    assert [r['participant'] for r in report if not r['valid']] == [victim_id]
+    rendered = [r['path'] for r in report if r['path']]
+    assert rendered == [os.path.join(str(tmp_path), f"participant_{victim_id}.png")]
+    assert os.path.getsize(rendered[0]) > 0
+    print(f"\n[+] Flagged dashboard written to {rendered[0]}")
+
+def test_export_all_dashboards_in_pool(tmp_path):
+    dealer = Dealer(3, 6)
+    data = dealer.distribute_secret()
+
+    report = export_dashboards(data['shares'], data['commitments'], str(tmp_path),
+                               fmt='svg', workers=2, chunk_size=2, engine=dealer.engine)
+
+    assert all(r['valid'] for r in report)
+    assert sorted(os.listdir(tmp_path)) == sorted(f"participant_{i}.svg" for i in range(1, 7))
+
+def test_valid_and_flagged_renders_differ(tmp_path):
+    """The same participant must look different when their share fails, with every glyph in the font."""
+    dealer = Dealer(3, 5)
+    data = dealer.distribute_secret()
+    viz = Visualizer(dealer.engine)
+
+    paths = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # e.g. "Glyph ... missing from font"
+        for is_valid in (True, False):
+            paths[is_valid] = str(tmp_path / f"p2_{is_valid}.png")
+            viz.render_dashboard(data['shares'], data['commitments'], 2, paths[is_valid], is_valid=is_valid)
+    viz.close()
+
+    valid_img, flagged_img = (Image.open(paths[v]).tobytes() for v in (True, False))
+    assert valid_img != flagged_img
+
+def test_export_leaves_pyplot_state_alone(tmp_path):
+    """Rendering in-process must not switch the caller's backend or leave figures open."""
+    dealer = Dealer(3, 4)
+    data = dealer.distribute_secret()
+    backend = matplotlib.get_backend()
+    open_figures = plt.get_fignums()
+
+    export_dashboards(data['shares'], data['commitments'], str(tmp_path), workers=1, engine=dealer.engine)
+
+    assert matplotlib.get_backend() == backend
+    assert plt.get_fignums() == open_figures
+
+def test_story_visualizer_headless(tmp_path):
+    open_figures = plt.get_fignums()
+    viz = StoryVisualizer(output_dir=str(tmp_path))
+    viz.plot_stage_1_the_secret(42, [42, 7, 3])
+    viz.plot_stage_2_the_oneway_mirror()
+
+    assert sorted(os.listdir(tmp_path)) == ["stage_1_the_secret.png", "stage_2_the_oneway_mirror.png"]
+    assert plt.get_fignums() == open_figures
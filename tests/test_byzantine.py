@@ -0,0 +1,52 @@
+import pytest
+from src.simulation.adversary import MaliciousDealer
+from src.simulation.byzantine import run_dealing, run_simulation
+
+@pytest.mark.parametrize("strategy", MaliciousDealer.STRATEGIES)
+def test_each_strategy_is_detected(strategy):
+    dealer = MaliciousDealer(3, 6)
+    result = run_dealing(dealer, strategy, num_corrupted=2)
+
+    print(f"\n[+] {strategy}: {result}")
+    assert result['detected'] == True
+
+def test_inconsistent_commitments_pass_individual_checks():
+    """Equivocation is invisible to share checks; only the commitment echo catches it."""
+    dealer = MaliciousDealer(3, 6)
+    result = run_dealing(dealer, "inconsistent_commitments", num_corrupted=2)
+
+    assert result['complaints'] == 0
+    assert result['equivocation'] == True
+
+def test_batched_auditor_agrees_with_participants():
+    """The auditor's combined check flags exactly the shares participants complain about."""
+    dealer = MaliciousDealer(3, 6)
+    for strategy in (None, "random_shares"):
+        result = run_dealing(dealer, strategy, num_corrupted=2)
+        assert result['auditor_flagged'] == result['complaints']
+        assert result['auditor_shares'] == 6
+
+def test_colluders_cannot_steer_reconstruction():
+    dealer = MaliciousDealer(3, 6)
+    result = run_dealing(dealer, "colluding", num_corrupted=2)
+
+    assert result['rejected_at_reconstruction'] == 2
+    assert result['reconstructed_ok'] == True
+
+def test_honest_dealings_are_never_flagged():
+    dealer = MaliciousDealer(3, 5)
+    for _ in range(5):
+        result = run_dealing(dealer)
+        assert result['detected'] == False
+        assert result['reconstructed_ok'] == True
+
+def test_simulation_report():
+    report = run_simulation(num_dealings=12, malicious_fraction=0.5, workers=2, chunk_size=4, seed=1)
+
+    assert report['dealings'] == 12
+    assert report['malicious'] == 6
+    assert report['detection_rate'] == 1.0
+    assert report['false_positive_rate'] == 0.0
+    assert report['reconstruction_success_rate'] == 1.0
+    assert report['verifications_per_sec'] > 0
+    assert report['batched_auditor_shares_per_cpu_sec'] > 0
@@ -0,0 +1,142 @@
+import secrets
+import pytest
+from src.vss_core.protocol import Dealer
+from src.vss_core.enrollment import PublicShareCache, helper_contribution, combine_contributions
+from src.vss_core.reconstruction import lagrange_coefficients
+
+def pairwise_seeds(xs):
+    """What each pair of helpers would agree on over a private channel: {x_i: {x_j: seed}}."""
+    seeds = {x: {} for x in xs}
+    for a in xs:
+        for b in xs:
+            if a < b:
+                seeds[a][b] = seeds[b][a] = secrets.token_bytes(32)
+    return seeds
+
+def test_dealer_enrolls_new_members():
+    """Late joiners get shares that verify against the original, unchanged commitments."""
+    t, n = 3, 5
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret(123456789)
+    cache = PublicShareCache(data['commitments'], dealer.engine)
+
+    for idx, share_val in data['shares']:
+        assert cache.verify_share(idx, share_val) == True
+
+    for new_index in range(n + 1, n + 6):
+        idx, share_val = dealer.enroll(new_index)['share']
+        assert cache.verify_share(idx, share_val) == True
+        assert dealer.engine.verify_share(idx, share_val, data['commitments']) == True
+        print(f"    Participant {idx}: enrolled and verified")
+
+    # A tampered enrollment is still caught
+    assert cache.verify_share(idx, share_val + 1) == False
+
+def test_cached_points_match_direct_evaluation():
+    dealer = Dealer(4, 6)
+    data = dealer.distribute_secret()
+    for cache in (PublicShareCache(data['commitments'], dealer.engine),
+                  PublicShareCache(data['commitments'], dealer.engine, next_index=7)):
+        for index in list(range(1, 15)) + [1000]:
+            assert cache.public_share_point(index) == dealer.engine.compute_verification_point(index, data['commitments'])
+
+def test_holders_enroll_without_dealer():
+    t, n = 3, 5
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret(99999)
+    order = dealer.engine.n
+    cache = PublicShareCache(data['commitments'], dealer.engine, next_index=n + 1)
+
+    # Each helper only uses its own share and the seeds it shares with the others
+    helpers = data['shares'][1:1 + t]
+    xs = [x for x, _ in helpers]
+    seeds = pairwise_seeds(xs)
+    contributions = [helper_contribution(share, xs, n + 1, seeds[share[0]], order) for share in helpers]
+    new_share = combine_contributions(n + 1, contributions, cache)
+
+    # Same share the dealer would have issued
+    assert new_share == dealer.enroll(n + 1)
+
+    # A contribution alone is masked: it is not the helper's Lagrange term
+    lagrange_term = lagrange_coefficients(xs, order, at=n + 1)[0] * helpers[0][1] % order
+    assert contributions[0][1] != lagrange_term
+
+    # A helper sending a wrong contribution is caught before the share is accepted
+    x, c = contributions[0]
+    with pytest.raises(ValueError):
+        combine_contributions(n + 1, [(x, c + 1)] + contributions[1:], cache)
+
+def test_holders_enroll_into_pedersen_dealing():
+    t, n = 3, 5
+    dealer = Dealer(t, n, pedersen=True)
+    data = dealer.distribute_secret()
+    order = dealer.engine.n
+    cache = PublicShareCache(data['commitments'], dealer.engine, next_index=n + 1, pedersen=True)
+
+    helpers = data['shares'][:t]
+    blinding = dict(data['blinding_shares'])
+    xs = [x for x, _ in helpers]
+    seeds = pairwise_seeds(xs)
+    contributions = [helper_contribution(share, xs, n + 1, seeds[share[0]], order) for share in helpers]
+    blinding_contributions = [helper_contribution((x, blinding[x]), xs, n + 1, seeds[x], order, blinding=True)
+                              for x in xs]
+
+    enrolled = combine_contributions(n + 1, contributions, cache, blinding_contributions)
+    assert enrolled == dealer.enroll(n + 1)
+
+    # Without the blinding side the new member is told what is missing, not that helpers cheated
+    with pytest.raises(ValueError, match="blinding"):
+        combine_contributions(n + 1, contributions, cache)
+
+def test_enrollment_rejects_secret_and_issued_indices():
+    t, n = 3, 5
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret()
+    order = dealer.engine.n
+    cache = PublicShareCache(data['commitments'], dealer.engine)
+
+    # Index 0 (mod order) is f(0), the secret itself
+    for bad_index in (0, order):
+        with pytest.raises(ValueError):
+            dealer.enroll(bad_index)
+        with pytest.raises(ValueError):
+            helper_contribution(data['shares'][0], [1, 2, 3], bad_index, {2: b"a", 3: b"b"}, order)
+        with pytest.raises(ValueError):
+            combine_contributions(bad_index, [], cache)
+
+    # Indices already holding a share are never issued twice
+    with pytest.raises(ValueError):
+        dealer.enroll(2)
+    with pytest.raises(ValueError):
+        dealer.enroll(order + 2)
+    dealer.enroll(n + 1)
+    with pytest.raises(ValueError):
+        dealer.enroll(n + 1)
+
+    # A new dealing starts a fresh set of issued indices
+    dealer.distribute_secret()
+    dealer.enroll(n + 1)
+
+def test_pedersen_enrollment():
+    dealer = Dealer(3, 5, pedersen=True)
+    data = dealer.distribute_secret()
+    cache = PublicShareCache(data['commitments'], dealer.engine)
+
+    enrolled = dealer.enroll(6)
+    idx, share_val = enrolled['share']
+    _, blind_val = enrolled['blinding_share']
+    assert cache.verify_share(idx, share_val, blind_val) == True
+    assert cache.verify_share(idx, share_val, blind_val + 1) == False
+
+def test_enroll_requires_a_dealing():
+    with pytest.raises(ValueError):
+        Dealer(3, 5).enroll(6)
+
+if __name__ == "__main__":
+    test_dealer_enrolls_new_members()
+    test_cached_points_match_direct_evaluation()
+    test_holders_enroll_without_dealer()
+    test_holders_enroll_into_pedersen_dealing()
+    test_enrollment_rejects_secret_and_issued_indices()
+    test_pedersen_enrollment()
+    test_enroll_requires_a_dealing()
@@ -1,30 +1,6 @@
 import pytest
-from src.vss_core.protocol import Dealer
 from src.vss_core.crypto_engine import CryptoEngine
-
-class MaliciousDealer(Dealer):
-    def distribute_corrupted_secret(self, secret, victim_id):
-        """
-        Runs the normal distribution, but intentionally modifies
-        the share for 'victim_id' so it no longer matches the polynomial.
-        """
-        # 1. Run honest distribution first
-        data = self.distribute_secret(secret)
-        
-        # 2. Corrupt the specific victim's share
-        corrupted_shares = []
-        for participant_id, share_val in data['shares']:
-            if participant_id == victim_id:
-                print(f"    [!] SABOTAGE: Corrupting share for Participant {participant_id}...")
-                # Add 1 to the share value (breaking the point on the curve)
-                fake_val = (share_val + 1) % self.engine.n
-                corrupted_shares.append((participant_id, fake_val))
-            else:
-                corrupted_shares.append((participant_id, share_val))
-        
-        # 3. Return the bundle with the fake share
-        data['shares'] = corrupted_shares
-        return data
+from src.simulation.adversary import MaliciousDealer
 
 def test_catch_cheater():
     print("\n[+] STARTING SECURITY AUDIT: Malicious Dealer Simulation")
@@ -38,6 +14,7 @@ def test_catch_cheater():
     victim_id = 2  # We will target Participant 2
     
     # Malicious Distribution
+    print(f"    [!] SABOTAGE: Corrupting share for Participant {victim_id}...")
     result = dealer.distribute_corrupted_secret(secret, victim_id)
     commitments = result['commitments']
     
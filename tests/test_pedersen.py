@@ -0,0 +1,87 @@
+import pytest
+from src.vss_core.protocol import Dealer
+from src.vss_core.crypto_engine import CryptoEngine
+
+def test_double_base_matches_naive():
+    """The joint a*G + b*H must equal the two separate multiplications."""
+    engine = CryptoEngine()
+    a = engine.generate_secret()
+    b = engine.generate_secret()
+
+    naive = a * engine.G + b * engine.H
+    assert engine.double_base_mul(a, b) == naive
+    assert engine.double_base_mul(a, 0) == a * engine.G
+    print("\n[+] Joint double-base multiplication matches a*G + b*H")
+
+def test_double_base_costs_like_feldman():
+    """Once warm, a*G + b*H is one joint-table addition per window, like a Feldman commitment."""
+    engine = CryptoEngine()
+    engine.warm_up(pedersen=True)
+    # No zero 4-bit digits, so every window costs an addition on both paths
+    a = sum(((k % 15) + 1) << (4 * k) for k in range(64))
+    b = sum(((k * 7 % 15) + 1) << (4 * k) for k in range(64))
+
+    calls = []
+    add = engine._add
+    def counting_add(p, q):
+        calls.append(p is q)
+        return add(p, q)
+    engine._add = counting_add
+
+    engine.fixed_base_mul(a)
+    feldman_adds = len(calls)
+    calls.clear()
+    assert engine.double_base_mul(a, b) == a * engine.G + b * engine.H
+    pedersen_adds = len(calls)
+
+    assert not any(calls)  # no doublings
+    assert pedersen_adds == feldman_adds == len(engine._joint_table)
+    print(f"\n[+] Point additions: Feldman {feldman_adds}, Pedersen {pedersen_adds}")
+
+def test_double_base_agrees_across_warm_up():
+    """The windowed, two-table and joint-table paths all give the same point."""
+    engine = CryptoEngine()
+    engine.JOINT_WARMUP = engine.COMB_WARMUP + 2
+    for step in range(engine.JOINT_WARMUP + 2):
+        a = engine.generate_secret()
+        b = engine.generate_secret()
+        assert engine.double_base_mul(a, b) == a * engine.G + b * engine.H
+    assert engine._joint_table is not None
+
+def test_pedersen_distribution_and_verification():
+    # 1. Setup: A 3-out-of-5 Scheme with hiding commitments
+    t, n = 3, 5
+    dealer = Dealer(t, n, pedersen=True)
+
+    secret = 123456789
+    result = dealer.distribute_secret(secret)
+    commitments = result['commitments']
+    blinding = dict(result['blinding_shares'])
+
+    # 2. C_0 no longer leaks secret * G
+    assert commitments[0] != dealer.engine.get_commitment(secret)
+
+    # 3. Every honest share verifies
+    for idx, share_val in result['shares']:
+        is_valid = dealer.engine.verify_pedersen_share(idx, share_val, blinding[idx], commitments)
+        print(f"    Participant {idx}: Pedersen verification -> {'VALID' if is_valid else 'INVALID'}")
+        assert is_valid == True
+
+def test_pedersen_rejects_tampering():
+    dealer = Dealer(3, 5, pedersen=True)
+    result = dealer.distribute_secret(99999)
+    commitments = result['commitments']
+    idx, share_val = result['shares'][1]
+    _, blind_val = result['blinding_shares'][1]
+
+    # Tampered share, and tampered blinding value
+    assert dealer.engine.verify_pedersen_share(idx, share_val + 1, blind_val, commitments) == False
+    assert dealer.engine.verify_pedersen_share(idx, share_val, blind_val + 1, commitments) == False
+    print("\n[+] Tampered Pedersen shares rejected")
+
+if __name__ == "__main__":
+    test_double_base_matches_naive()
+    test_double_base_costs_like_feldman()
+    test_double_base_agrees_across_warm_up()
+    test_pedersen_distribution_and_verification()
+    test_pedersen_rejects_tampering()
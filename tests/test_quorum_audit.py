@@ -0,0 +1,92 @@
+import pytest
+from itertools import combinations
+from math import comb
+from src.vss_core.protocol import Dealer
+from src.vss_core.reconstruction import reconstruct_secret
+from src.vss_core.quorum_audit import revolving_door, audit_quorums
+
+def test_revolving_door_visits_every_quorum_once():
+    """Each step swaps exactly one index, and all C(n, t) subsets appear."""
+    n, t = 8, 3
+    steps = revolving_door(n, t)
+    current = set(next(steps))
+    seen = {frozenset(current)}
+
+    for removed, added in steps:
+        assert removed in current and added not in current
+        current.remove(removed)
+        current.add(added)
+        seen.add(frozenset(current))
+
+    assert seen == {frozenset(c) for c in combinations(range(n), t)}
+
+def test_reconstruct_secret_from_any_quorum():
+    dealer = Dealer(3, 5)
+    data = dealer.distribute_secret(424242)
+    shares = data['shares']
+
+    for quorum in combinations(shares, 3):
+        assert reconstruct_secret(list(quorum), dealer.engine.n) == 424242
+
+def test_full_audit_is_consistent():
+    t, n = 4, 9
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret()
+
+    report = audit_quorums(data['shares'], t, dealer.engine.n)
+    print(f"\n[+] Audited {report['quorums']} quorums at {report['quorums_per_sec']:.0f} quorums/s")
+
+    assert report['quorums'] == comb(n, t)
+    assert report['consistent'] == True
+    assert report['secret'] == data['secret_kept_by_dealer']
+
+def test_audit_flags_quorums_with_corrupted_share():
+    t, n = 3, 7
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret(99999)
+
+    # Corrupt Participant 4: every quorum containing it reconstructs the wrong value
+    shares = [(pid, val + 1 if pid == 4 else val) for pid, val in data['shares']]
+    report = audit_quorums(shares, t, dealer.engine.n, expected_secret=99999, max_examples=100)
+
+    assert report['consistent'] == False
+    assert report['mismatches'] == comb(n - 1, t - 1)
+    assert all(4 in quorum for quorum in report['examples'])
+
+def test_sampled_audit():
+    t, n = 5, 20
+    dealer = Dealer(t, n)
+    data = dealer.distribute_secret()
+
+    report = audit_quorums(data['shares'], t, dealer.engine.n, sample=500, seed=7)
+    assert report['quorums'] == 500
+    assert 1 < report['distinct_quorums'] <= 500
+    assert report['consistent'] == True
+    assert report['secret'] == data['secret_kept_by_dealer']
+
+def test_sampled_audit_counts_revisits_and_small_spaces():
+    dealer = Dealer(2, 4)
+    data = dealer.distribute_secret()
+    shares = [(pid, val + 1 if pid == 3 else val) for pid, val in data['shares']]
+    order = dealer.engine.n
+
+    # A 5-step walk over the 6 quorums of a 2-of-4 dealing revisits some; each is only reported once
+    report = audit_quorums(shares, 2, order, sample=5, seed=1, max_examples=100)
+    assert report['quorums'] == 5
+    assert report['distinct_quorums'] < 5
+    assert len(report['examples']) == report['mismatches'] <= report['distinct_quorums']
+
+    # Samples at or above C(n, t), including t == n, audit every quorum
+    report = audit_quorums(shares, 2, order, sample=100, expected_secret=data['secret_kept_by_dealer'])
+    assert report['quorums'] == report['distinct_quorums'] == comb(4, 2)
+    assert report['mismatches'] == 3
+    report = audit_quorums(data['shares'], 4, order, sample=500)
+    assert report['quorums'] == report['distinct_quorums'] == 1
+
+if __name__ == "__main__":
+    test_revolving_door_visits_every_quorum_once()
+    test_reconstruct_secret_from_any_quorum()
+    test_full_audit_is_consistent()
+    test_audit_flags_quorums_with_corrupted_share()
+    test_sampled_audit()
+    test_sampled_audit_counts_revisits_and_small_spaces()
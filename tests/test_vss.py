@@ -1,5 +1,9 @@
+import json
 import pytest
-from src.vss_core.crypto_engine import CryptoEngine
+import subprocess
+import sys
+from src.vss_core.crypto_engine import CryptoEngine, get_engine
+from src.vss_core.protocol import Dealer
 
 def test_engine_initialization():
     """Test that the engine loads the curve correctly."""
@@ -44,7 +48,60 @@ def test_manual_verification_logic():
     assert is_valid_fake == False
     print("    -> Tampered Share Rejected Successfully!")
 
+def test_shared_engine_cache():
+    """Dealers without an explicit engine share one engine (and its tables) per curve."""
+    assert get_engine() is get_engine('secp256r1')
+    assert Dealer(3, 5).engine is Dealer(2, 4).engine is get_engine()
+
+    # An explicitly passed engine is still used as-is
+    own_engine = CryptoEngine()
+    assert Dealer(3, 5, engine=own_engine).engine is own_engine
+
+def test_core_imports_without_visual_dependencies():
+    """The protocol core must not pull in matplotlib or numpy."""
+    code = (
+        "import sys, src.vss_core.protocol, src.vss_core.quorum_audit; "
+        "print(sorted(m for m in ('matplotlib', 'numpy') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+def test_cold_verifier_skips_table_build():
+    """A fresh process that only verifies one share must not pay for the fixed-base table."""
+    dealer = Dealer(3, 5)
+    data = dealer.distribute_secret()
+    idx, share_val = data['shares'][2]
+    job = json.dumps({"commitments": [[c.x, c.y] for c in data['commitments']],
+                      "index": idx, "share": share_val})
+
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from tinyec.ec import Point\n"
+        "from src.vss_core.crypto_engine import get_engine\n"
+        "job = json.loads(sys.stdin.read())\n"
+        "engine = get_engine()\n"
+        "commitments = [Point(engine.curve, x, y) for x, y in job['commitments']]\n"
+        "imported = time.perf_counter()\n"
+        "valid = engine.verify_share(job['index'], job['share'], commitments)\n"
+        "verified = time.perf_counter()\n"
+        "cold = engine._g_table is None\n"
+        "engine._get_fixed_base_table()\n"
+        "print(json.dumps({'valid': valid, 'cold': cold, 'import': imported - start,\n"
+        "                  'verify': verified - imported, 'table': time.perf_counter() - verified}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], input=job, capture_output=True, text=True, check=True)
+    timings = json.loads(out.stdout)
+    print(f"\n[+] Cold verifier: import {timings['import'] * 1000:.0f} ms, first verify "
+          f"{timings['verify'] * 1000:.0f} ms (table build would add {timings['table'] * 1000:.0f} ms)")
+
+    assert timings['valid'] == True
+    assert timings['cold'] == True
+    assert timings['verify'] < timings['table']
+
 if __name__ == "__main__":
     # Allow running directly with 'python tests/test_vss.py'
     test_engine_initialization()
-    test_manual_verification_logic()
\ No newline at end of file
+    test_manual_verification_logic()
+    test_shared_engine_cache()
+    test_core_imports_without_visual_dependencies()
\ No newline at end of file